@@ -1,7 +1,8 @@
 import pyaudio
 import numpy as np
 from config import Config
-from error_handler import log_error, handle_error, AudioError
+from audio_processing import StreamingResampler
+from error_handler import log_error, handle_error, log_info, AudioError
 from playsound import playsound
 
 class AudioManager:
@@ -9,6 +10,7 @@ class AudioManager:
         self.pa = pyaudio.PyAudio()
         self.audio_stream = None
         self.is_listening = False
+        self.resampler = None
 
     @staticmethod
     def get_audio_devices():
@@ -22,18 +24,60 @@ class AudioManager:
         p.terminate()
         return devices
 
+    def get_capture_format(self, device_info):
+        """Pick a capture rate and channel count the device supports.
+
+        With INPUT_CHANNEL set, the narrowest multi-channel width that contains
+        that channel is tried first, then all of the device's input channels. Otherwise stereo is
+        tried first so it is downmixed, then mono, then all input channels.
+        CAPTURE_CHANNELS overrides the width. Each width is tried at RATE, then at
+        the device's default rate, unless CAPTURE_RATE is set.
+        """
+        max_channels = int(device_info['maxInputChannels'])
+        rates = [Config.CAPTURE_RATE] if Config.CAPTURE_RATE else [Config.RATE, int(device_info['defaultSampleRate'])]
+        if Config.CAPTURE_CHANNELS:
+            widths = [Config.CAPTURE_CHANNELS]
+        elif Config.INPUT_CHANNEL is not None:
+            widths = [max(Config.INPUT_CHANNEL + 1, 2), max_channels]
+        else:
+            widths = [min(2, max_channels), 1, max_channels]
+        if Config.INPUT_CHANNEL is not None:
+            widths = [channels for channels in widths if channels > Config.INPUT_CHANNEL]
+
+        tried = []
+        for channels in widths:
+            if channels > max_channels:
+                continue
+            for rate in rates:
+                if (rate, channels) in tried:
+                    continue
+                tried.append((rate, channels))
+                try:
+                    self.pa.is_format_supported(rate, input_device=device_info['index'],
+                                                input_channels=channels, input_format=Config.FORMAT)
+                except ValueError:
+                    continue
+                if len(tried) > 1:
+                    log_info(f"Device does not support {tried[0][1]} channel(s) at {tried[0][0]} Hz, "
+                             f"falling back to {channels} channel(s) at {rate} Hz")
+                return rate, channels
+        raise AudioError(f"No supported capture format on a {max_channels} channel device (tried {tried})")
+
     @log_error
     def start_listening(self, device_index, callback):
         try:
             self.is_listening = True
             device_info = self.pa.get_device_info_by_index(device_index)
+            rate, channels = self.get_capture_format(device_info)
+            self.resampler = StreamingResampler(rate, Config.RATE, channels, Config.INPUT_CHANNEL)
+            log_info(f"Capturing {channels} channel(s) at {rate} Hz")
             self.audio_stream = self.pa.open(
                 format=Config.FORMAT,
-                channels=Config.CHANNELS,
-                rate=Config.RATE,
+                channels=channels,
+                rate=rate,
                 input=True,
                 input_device_index=device_info['index'],
-                frames_per_buffer=Config.CHUNK,
+                frames_per_buffer=Config.CHUNK * rate // Config.RATE,
                 stream_callback=callback
             )
             self.audio_stream.start_stream()
@@ -49,6 +93,10 @@ class AudioManager:
             self.audio_stream.stop_stream()
             self.audio_stream.close()
 
+    def to_model_format(self, in_data):
+        """Convert a raw capture buffer to mono int16 samples at Config.RATE."""
+        return self.resampler(np.frombuffer(in_data, dtype=np.int16))
+
     @staticmethod
     def normalize_audio(audio_data):
         return audio_data.astype(np.float32) / 32768.0
@@ -1,5 +1,8 @@
 import numpy as np
 import pyaudio
+import time
+from math import gcd
+from numpy.lib.stride_tricks import sliding_window_view
 
 def normalize_audio(audio_data):
     return audio_data.astype(np.float32) / 32768.0
@@ -33,4 +36,96 @@ def get_audio_devices():
         if (p.get_device_info_by_host_api_device_index(0, i).get('maxInputChannels')) > 0:
             devices.append(f"{i}: {p.get_device_info_by_host_api_device_index(0, i).get('name')}")
     p.terminate()
-    return devices
\ No newline at end of file
+    return devices
+
+class StreamingResampler:
+    """Downmix (or select a channel) and resample interleaved int16 audio to mono at out_rate.
+
+    Uses a Kaiser-windowed polyphase FIR filter; filter history and phase are kept
+    across calls so consecutive buffers resample as one continuous stream.
+    """
+
+    def __init__(self, in_rate, out_rate, channels=1, channel=None, beta=8.0):
+        if channel is not None and (channels == 1 or channel not in range(channels)):
+            raise ValueError(f"Input channel {channel} is not valid for a {channels} channel stream")
+        self.channels = channels
+        self.channel = channel
+        g = gcd(int(in_rate), int(out_rate))
+        self.up = int(out_rate) // g
+        self.down = int(in_rate) // g
+        self.passthrough = self.up == self.down
+
+        if not self.passthrough:
+            half_len = 16 * max(self.up, self.down)
+            n = np.arange(-half_len, half_len + 1)
+            # Cutoff below the output Nyquist so the transition band is fully
+            # attenuated by Nyquist and nothing above it aliases into the mel bands
+            cutoff = 0.9 / max(self.up, self.down)
+            h = cutoff * np.sinc(cutoff * n) * np.kaiser(len(n), beta) * self.up
+            self.taps_per_phase = -(-len(h) // self.up)
+            h = np.pad(h, (0, self.taps_per_phase * self.up - len(h)))
+            # Row p holds the taps applied for output phase p, reversed so a row
+            # lines up with a forward-ordered window of input samples.
+            self.phases = h.reshape(self.taps_per_phase, self.up).T[:, ::-1].astype(np.float32)
+        self.reset()
+
+    def reset(self):
+        """Clear filter history and phase, e.g. when a new stream is opened."""
+        if not self.passthrough:
+            self.history = np.zeros(self.taps_per_phase - 1, dtype=np.float32)
+        self.position = 0  # upsampled-rate position of the next output, relative to the next buffer
+
+    def _to_mono(self, audio_data):
+        if self.channels == 1:
+            return audio_data
+        frames = audio_data.reshape(-1, self.channels)
+        if self.channel is not None:
+            return frames[:, self.channel]
+        return frames.mean(axis=1, dtype=np.float32)
+
+    def __call__(self, audio_data):
+        mono = self._to_mono(audio_data)
+        if self.passthrough:
+            return mono if mono.dtype == np.int16 else np.round(mono).astype(np.int16)
+
+        n_in = mono.shape[0]
+        if n_in == 0:
+            return np.empty(0, dtype=np.int16)
+        buf = np.concatenate((self.history, mono.astype(np.float32, copy=False)))
+        n_out = max(0, -(-(n_in * self.up - self.position) // self.down))
+        t = self.position + self.down * np.arange(n_out)
+        windows = sliding_window_view(buf, self.taps_per_phase)[t // self.up]
+        out = np.einsum('ij,ij->i', windows, self.phases[t % self.up])
+
+        self.position += n_out * self.down - n_in * self.up
+        self.history = buf[-(self.taps_per_phase - 1):] if self.taps_per_phase > 1 else buf[:0]
+        return np.clip(np.round(out), -32768, 32767).astype(np.int16)
+
+def benchmark_resampler(in_rate, channels, out_rate=16000, chunk=1024, n_buffers=500):
+    """Return the mean cost in microseconds of converting one buffer to chunk samples at out_rate mono."""
+    resampler = StreamingResampler(in_rate, out_rate, channels)
+    frames = chunk * in_rate // out_rate
+    audio_data = np.random.randint(-1000, 1000, frames * channels).astype(np.int16)
+    resampler(audio_data)
+    start = time.perf_counter()
+    for _ in range(n_buffers):
+        resampler(audio_data)
+    return (time.perf_counter() - start) / n_buffers * 1e6
+
+def benchmark_streaming_features(chunk=1024, n_buffers=200):
+    """Return the mean cost in microseconds of AudioFeatures._streaming_features on one chunk-sample buffer."""
+    from model import AudioFeatures
+    features = AudioFeatures()
+    audio_data = np.random.randint(-1000, 1000, chunk).astype(np.int16)
+    for _ in range(20):
+        features(audio_data)
+    start = time.perf_counter()
+    for _ in range(n_buffers):
+        features(audio_data)
+    return (time.perf_counter() - start) / n_buffers * 1e6
+
+if __name__ == "__main__":
+    from config import Config
+    print(f"_streaming_features: {benchmark_streaming_features(Config.CHUNK):.1f} us/buffer")
+    for in_rate, channels in [(16000, 1), (16000, 2), (22050, 1), (44100, 1), (44100, 2), (48000, 1), (48000, 2), (48000, 8)]:
+        print(f"resample {in_rate} Hz x{channels}: {benchmark_resampler(in_rate, channels, chunk=Config.CHUNK):.1f} us/buffer")
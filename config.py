@@ -5,7 +5,19 @@ class Config:
     CHUNK = 1024
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
-    RATE = 16000
+    RATE = 16000  # rate and channel count the model expects
+
+    # Capture settings; None tries RATE first, then the device's default rate
+    CAPTURE_RATE = None
+    CAPTURE_CHANNELS = None  # None picks the narrowest channel count that fits INPUT_CHANNEL
+    INPUT_CHANNEL = None  # channel index to keep (opens at least max(INPUT_CHANNEL + 1, 2) channels); None downmixes
+
+    # Logging settings
+    LOG_FILE = "wake_word_app.log"
+    LOG_QUEUE_SIZE = 1000  # records buffered before new ones are dropped
+    LOG_RATE_LIMIT_INTERVAL = 5.0  # seconds between repeats of an identical message
+    LOG_RATE_LIMIT_KEYS = 256  # distinct messages tracked by the rate limiter
+    LOG_SHUTDOWN_TIMEOUT = 2.0  # seconds to wait for room in the queue when stopping the listener
 
     # Wake word detection settings
     WAKE_WORD_THRESHOLD = 0.5
@@ -1,19 +1,176 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+from config import Config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("wake_word_app.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records are dropped and counted when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._drop_lock = threading.Lock()
+        self.dropped = 0  # total since startup
+        self._unreported = 0  # dropped since the last record that made it into the queue
+
+    def prepare(self, record):
+        # Render the traceback here, while exc_info is still valid, but keep it
+        # separate from the message so the JSON formatter can emit it as a field.
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        # emit() is also called directly for summaries, so don't rely on the handler lock
+        with self._drop_lock:
+            record.dropped = self._unreported
+            try:
+                self.queue.put_nowait(record)
+                self._unreported = 0
+            except queue.Full:
+                self.dropped += 1
+                self._unreported += 1
+
+class RateLimitFilter(logging.Filter):
+    """Let an identical message through at most once per interval, counting the repeats in between.
+
+    Entries are kept in emission order and bounded to max_keys, so each call does
+    constant work. When an entry expires or is evicted its suppressed count is
+    passed to report(name, levelno, message, suppressed).
+    """
+
+    def __init__(self, interval, max_keys, report):
+        super().__init__()
+        self.interval = interval
+        self.max_keys = max_keys
+        self.report = report
+        self._lock = threading.Lock()
+        self._seen = OrderedDict()  # (name, levelno, message) -> [last_emitted, suppressed]
+
+    def _pop_expired(self, now):
+        pending = []
+        while self._seen:
+            key, entry = next(iter(self._seen.items()))
+            if now - entry[0] < self.interval and len(self._seen) <= self.max_keys:
+                break
+            self._seen.popitem(last=False)
+            if entry[1]:
+                pending.append((key, entry[1]))
+        return pending
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pop_expired(now)
+            entry = self._seen.get(key)
+            if entry is not None:
+                entry[1] += 1
+            else:
+                self._seen[key] = [now, 0]
+                pending += self._pop_expired(now)
+        for (name, levelno, message), suppressed in pending:
+            self.report(name, levelno, message, suppressed)
+        return entry is None
+
+    def flush(self):
+        """Report and clear every pending suppressed count."""
+        with self._lock:
+            pending = [(key, entry[1]) for key, entry in self._seen.items() if entry[1]]
+            self._seen.clear()
+        for (name, levelno, message), suppressed in pending:
+            self.report(name, levelno, message, suppressed)
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "error_type", None):
+            entry["error_type"] = record.error_type
+        if getattr(record, "dropped", 0):
+            entry["dropped_before"] = record.dropped
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry)
+
+class BlockingSentinelListener(QueueListener):
+    """QueueListener whose stop sentinel waits for room instead of failing on a full queue."""
+
+    def __init__(self, log_queue, *handlers, timeout, **kwargs):
+        super().__init__(log_queue, *handlers, **kwargs)
+        self.timeout = timeout
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel, timeout=self.timeout)
+
+def _summary_record(name, levelno, message):
+    return logging.makeLogRecord({"name": name, "levelno": levelno,
+                                  "levelname": logging.getLevelName(levelno), "msg": message})
+
+# Configure logging: callers only enqueue, file and console I/O happen on the listener thread
+_log_queue = queue.Queue(maxsize=Config.LOG_QUEUE_SIZE)
+_queue_handler = DroppingQueueHandler(_log_queue)
+
+def _report_suppressed(name, levelno, message, suppressed):
+    # Bypass the filter so the summary is not itself rate-limited
+    _queue_handler.emit(_summary_record(name, levelno, f"{message} (suppressed {suppressed} repeats)"))
+
+_rate_limit_filter = RateLimitFilter(Config.LOG_RATE_LIMIT_INTERVAL, Config.LOG_RATE_LIMIT_KEYS, _report_suppressed)
+_queue_handler.addFilter(_rate_limit_filter)
+
+_file_handler = logging.FileHandler(Config.LOG_FILE)
+_file_handler.setFormatter(JsonFormatter())
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+_listener = BlockingSentinelListener(_log_queue, _file_handler, _stream_handler,
+                                     timeout=Config.LOG_SHUTDOWN_TIMEOUT, respect_handler_level=True)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_listener.start()
 
 logger = logging.getLogger("WakeWordApp")
 
+def get_dropped_count():
+    """Return the number of log records dropped because the queue was full."""
+    return _queue_handler.dropped
+
+@atexit.register
+def shutdown_logging():
+    """Flush queued records, stop the listener thread and write any pending summaries."""
+    try:
+        _listener.stop()
+    except queue.Full:
+        pass  # listener is stuck; still write the summaries below
+
+    # The listener is gone, so summaries go straight to its handlers instead of the queue
+    def write(name, levelno, message):
+        record = _summary_record(name, levelno, message)
+        for handler in _listener.handlers:
+            handler.handle(record)
+
+    _rate_limit_filter.report = lambda name, levelno, message, suppressed: write(
+        name, levelno, f"{message} (suppressed {suppressed} repeats)")
+    _rate_limit_filter.flush()
+    if _queue_handler.dropped:
+        write(logger.name, logging.WARNING, f"Dropped {_queue_handler.dropped} log records (queue full)")
+
 class AppError(Exception):
     """Base class for application-specific errors."""
     pass
@@ -38,7 +195,7 @@ def log_error(func):
 
 def handle_error(error_type, message):
     """Handle errors by logging them and optionally performing additional actions."""
-    logger.error(f"{error_type}: {message}")
+    logger.error(f"{error_type.__name__}: {message}", extra={"error_type": error_type.__name__})
     # Add any additional error handling logic here, such as showing an error dialog
 
 def log_info(message):
@@ -47,4 +204,4 @@ def log_info(message):
 
 def log_warning(message):
     """Log a warning message."""
-    logger.warning(message)
\ No newline at end of file
+    logger.warning(message)
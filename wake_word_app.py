@@ -5,7 +5,7 @@ import time
 import threading
 import pyaudio
 from model import Model
-from error_handler import log_error, handle_error, ModelError
+from error_handler import log_error, handle_error, ModelError, AudioError
 from config import Config
 from gui_components import DeviceFrame, ModelFrame, ToggleButton, StatusLabel, RMSMeter, WakeWordIndicator
 from audio_manager import AudioManager
@@ -97,7 +97,7 @@ class WakeWordApp:
 
     def audio_callback(self, in_data, frame_count, time_info, status):
         try:
-            audio_data = np.frombuffer(in_data, dtype=np.int16)
+            audio_data = self.audio_manager.to_model_format(in_data)
             self.current_rms, self.current_predictions = self.process_audio_data(audio_data)
             return (in_data, pyaudio.paContinue)
         except Exception as e: